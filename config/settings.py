@@ -169,3 +169,4 @@ CO2_MOVING_RATE = 0.0023  # kg CO2 per frame per moving vehicle
 COLLISION_SAFE_MARGIN = 1          # extra pixels around bounding box for safe distance
 INTERSECTION_MAX_OCCUPANTS = 20    # max vehicles allowed in intersection simultaneously
 COLLISION_DEBUG_ASSERTIONS = True   # enable overlap logging (disable for max perf)
+COLLISION_GRID_CELL = 40           # spatial-hash cell size (px) for the pairwise broad phase
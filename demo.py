@@ -22,7 +22,6 @@ from config.settings import (
 )
 from simulation.road_network import Intersection
 from simulation.vehicle import VehicleSpawner, VehicleState
-from simulation.traffic_light import TrafficLightState
 from simulation.collision import CollisionManager
 from controllers.timer_controller import TimerController
 from controllers.dqn_controller import DQNController
@@ -80,6 +79,7 @@ def run_demo():
                                      SCREEN_HEIGHT // 2 + 15))
             pygame.display.flip()
             clock.tick(30)
+        renderer.invalidate()
 
     # ── Helper: run simulation for N seconds ──
     def run_phase(controller, mode_name, seconds):
@@ -97,15 +97,11 @@ def run_demo():
                     pygame.quit(); sys.exit()
 
             spawner.try_spawn_all_directions(vehicles)
-            light_states = controller.get_state()
+            light_flags = controller.get_light_flags()
 
             # ── Two-phase collision-aware update ──
             # Phase 1: All vehicles propose their next position
-            proposals = []
-            for v in vehicles:
-                is_green = light_states[v.direction] == TrafficLightState.GREEN
-                is_yellow = light_states[v.direction] == TrafficLightState.YELLOW
-                proposals.append(v.propose_move(is_green, is_yellow))
+            proposals = [v.propose_move(*light_flags[v.direction]) for v in vehicles]
 
             # Phase 2: Validate all proposals simultaneously
             approved, rejected = collision_mgr.validate_all(
@@ -127,8 +123,7 @@ def run_demo():
                     if v.wait_time > max_wait:
                         max_wait = v.wait_time
                     dashboard.record_passed(v)
-                    if v in v.lane.vehicles:
-                        v.lane.vehicles.remove(v)
+                    v.lane.remove_vehicle(v)
                     vehicles.remove(v)
 
             controller.step()
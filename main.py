@@ -20,7 +20,6 @@ from config.settings import (
 )
 from simulation.road_network import Intersection
 from simulation.vehicle import VehicleSpawner, VehicleState
-from simulation.traffic_light import TrafficLightState
 from controllers.timer_controller import TimerController
 from controllers.rule_based_controller import RuleBasedController
 from controllers.dqn_controller import DQNController
@@ -140,15 +139,11 @@ def main():
         spawner.set_rate(spawn_rate)
         spawner.try_spawn_all_directions(vehicles)
 
-        light_states = active_controller.get_state()
+        light_flags = active_controller.get_light_flags()
 
         # ── Two-phase collision-aware update ──
         # Phase 1: All vehicles propose their next position
-        proposals = []
-        for v in vehicles:
-            is_green = light_states[v.direction] == TrafficLightState.GREEN
-            is_yellow = light_states[v.direction] == TrafficLightState.YELLOW
-            proposals.append(v.propose_move(is_green, is_yellow))
+        proposals = [v.propose_move(*light_flags[v.direction]) for v in vehicles]
 
         # Phase 2: Validate all proposals simultaneously
         approved, rejected = collision_mgr.validate_all(
@@ -165,8 +160,7 @@ def main():
         for v in vehicles[:]:
             if v.has_crossed():
                 dashboard.record_passed(v)
-                if v in v.lane.vehicles:
-                    v.lane.vehicles.remove(v)
+                v.lane.remove_vehicle(v)
                 vehicles.remove(v)
 
         active_controller.step()
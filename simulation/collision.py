@@ -20,16 +20,18 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, TYPE_CHECKING
 
+import numpy as np
 import pygame
 
 from config.settings import (
     COLLISION_SAFE_MARGIN,
     INTERSECTION_MAX_OCCUPANTS,
     COLLISION_DEBUG_ASSERTIONS,
+    COLLISION_GRID_CELL,
 )
 
 if TYPE_CHECKING:
-    from simulation.vehicle import Vehicle
+    from simulation.vehicle import Vehicle, VehicleState
 
 logger = logging.getLogger("collision")
 
@@ -38,7 +40,7 @@ logger = logging.getLogger("collision")
 # Data Structures
 # ═══════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class MoveProposal:
     """Encapsulates a vehicle's proposed next state before committing."""
     vehicle: "Vehicle"
@@ -46,7 +48,7 @@ class MoveProposal:
     next_y: float
     next_rect: pygame.Rect
     next_speed: float
-    next_state: str  # VehicleState value
+    next_state: "VehicleState"
     approved: bool = True
 
     # Priority for conflict resolution (higher = more important)
@@ -104,6 +106,70 @@ def safe_distance_overlap(a: pygame.Rect, b: pygame.Rect, margin: int) -> bool:
     return aabb_overlap(inflate_rect(a, margin), inflate_rect(b, margin // 2))
 
 
+def grid_cells(rect: pygame.Rect, cell: int = COLLISION_GRID_CELL) -> List[Tuple[int, int]]:
+    """
+    Uniform spatial-hash broad phase: every (col, row) grid cell of size
+    *cell* that *rect* touches. Two rects can only overlap if they share
+    at least one cell.
+    """
+    left, top = rect.left, rect.top
+    return [
+        (cx, cy)
+        for cx in range(left // cell, max(left, rect.right - 1) // cell + 1)
+        for cy in range(top // cell, max(top, rect.bottom - 1) // cell + 1)
+    ]
+
+
+def rect_edges(vehicles: list) -> np.ndarray:
+    """(N, 4) int32 array of each vehicle's current (x1, y1, x2, y2) rect edges."""
+    if not vehicles:
+        return np.empty((0, 4), dtype=np.int32)
+    edges = np.array([tuple(v.rect) for v in vehicles], dtype=np.int32)
+    edges[:, 2] += edges[:, 0]
+    edges[:, 3] += edges[:, 1]
+    return edges
+
+
+def _overlap_matrix(edges: np.ndarray) -> np.ndarray:
+    """Symmetric (N, N) bool matrix of AABB overlaps between (x1, y1, x2, y2) rows."""
+    x1, y1, x2, y2 = edges[:, 0], edges[:, 1], edges[:, 2], edges[:, 3]
+    return (
+        (x1[:, None] < x2)
+        & (x2[:, None] > x1)
+        & (y1[:, None] < y2)
+        & (y2[:, None] > y1)
+    )
+
+
+def overlap_pairs(edges: np.ndarray) -> np.ndarray:
+    """
+    (K, 2) row-index pairs of overlapping rects in *edges* (x1, y1, x2, y2).
+
+    Sort-and-sweep on x: after sorting by x1, rect i can only overlap the
+    rects that follow it while their x1 is still left of its x2, so only
+    those candidates are materialised and tested on the other edges.
+    """
+    n = len(edges)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.intp)
+    order = np.argsort(edges[:, 0], kind="stable")
+    x1, y1, x2, y2 = edges[order].T
+
+    # Candidates for sorted rect i are i+1 .. stop[i]-1
+    stop = np.searchsorted(x1, x2, side="left")
+    counts = np.maximum(stop - np.arange(n) - 1, 0)
+    i = np.repeat(np.arange(n), counts)
+    j = i + 1 + np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    hit = (x2[j] > x1[i]) & (y1[i] < y2[j]) & (y2[i] > y1[j])
+    return np.stack([order[i[hit]], order[j[hit]]], axis=1)
+
+
+def count_overlaps(edges: np.ndarray) -> int:
+    """Number of overlapping pairs among the (x1, y1, x2, y2) rows of *edges*."""
+    return len(overlap_pairs(edges))
+
+
 # ═══════════════════════════════════════════════
 # CollisionManager
 # ═══════════════════════════════════════════════
@@ -119,6 +185,8 @@ class CollisionManager:
 
     def __init__(self):
         self._collision_count = 0
+        # (x1, y1, x2, y2) of every proposal's next_rect; grown on demand
+        self._rect_buf = np.empty((0, 4), dtype=np.int32)
 
     @property
     def collision_count(self) -> int:
@@ -137,13 +205,15 @@ class CollisionManager:
 
         1.  Compute priorities for all proposals.
         2.  Check pairwise AABB overlaps (with safe margin) on proposed rects.
-        3.  In every conflicting pair, reject the lower-priority vehicle.
+        3.  Accept proposals greedily in priority order; reject any that
+            overlaps an already accepted one.
         4.  (Iterative) Check approved proposals against the CURRENT rect
             of rejected vehicles — rejected vehicles stay in place.
         5.  Enforce intersection occupancy cap.
         6.  Return (approved, rejected) lists.
 
-        Complexity: O(n²) pairwise – fine for n ≤ 200.
+        Complexity: O(n log n) pairwise phase (priority sort + spatial-hash
+        grid); the rejected-vehicle passes remain O(n²) worst case.
         """
         self._collision_count = 0
 
@@ -157,95 +227,172 @@ class CollisionManager:
 
         # Phase 2 — iterative: check approved proposals against current
         # positions of rejected vehicles (rejected stay at their current rect)
-        self._resolve_against_rejected(proposals)
+        rects = self._fill_rect_buf(proposals)
+        self._resolve_against_rejected(proposals, rects)
 
         # Phase 3 — intersection occupancy cap
         self._enforce_intersection_cap(proposals, intersection_rect)
 
         # Phase 4 — final: check approved proposals against current positions
         # of all OTHER vehicles (catches pre-existing proximity)
-        self._resolve_against_rejected(proposals)
+        self._resolve_against_rejected(proposals, rects)
 
         approved = [p for p in proposals if p.approved]
         rejected = [p for p in proposals if not p.approved]
         return approved, rejected
 
+    def validate_all_raw(
+        self,
+        rects: np.ndarray,
+        priorities: np.ndarray,
+        intersection_rect: pygame.Rect,
+    ) -> np.ndarray:
+        """
+        Array-based variant of validate_all for callers without Vehicle objects.
+
+        *rects* is an (N, 4) array of proposed (x1, y1, x2, y2) edges and
+        *priorities* an (N,) array (higher wins; ties → lower index). Runs
+        the pairwise and intersection-cap phases — there are no current
+        positions to check against — and returns a boolean approval mask.
+        """
+        self._collision_count = 0
+        rects = np.asarray(rects)
+        n = len(rects)
+        approved = np.ones(n, dtype=bool)
+        if n == 0:
+            return approved
+
+        # Priority order: highest first, ties → lower index
+        order = np.lexsort((np.arange(n), -np.asarray(priorities)))
+
+        # Phase 1 — greedy first-fit on the inflated rects
+        margin = COLLISION_SAFE_MARGIN
+        overlap = _overlap_matrix(rects + np.array([-margin, -margin, margin, margin]))
+        accepted = np.zeros(n, dtype=bool)
+        for i in order:
+            hits = int((overlap[i] & accepted).sum())
+            if hits:
+                approved[i] = False
+                self._collision_count += hits  # one per conflicting pair
+            else:
+                accepted[i] = True
+
+        # Phase 2 — intersection occupancy cap
+        iz = intersection_rect
+        in_zone = approved & (
+            (rects[:, 0] < iz.right)
+            & (rects[:, 2] > iz.left)
+            & (rects[:, 1] < iz.bottom)
+            & (rects[:, 3] > iz.top)
+        )
+        excess = order[in_zone[order]][INTERSECTION_MAX_OCCUPANTS:]
+        approved[excess] = False
+        self._collision_count += len(excess)
+        return approved
+
     # ── internals ─────────────────────────────
 
+    def _fill_rect_buf(self, proposals: List[MoveProposal]) -> np.ndarray:
+        """Copy every proposal's next_rect edges into the reusable (N, 4) buffer."""
+        n = len(proposals)
+        if n > len(self._rect_buf):
+            self._rect_buf = np.empty((max(n, 2 * len(self._rect_buf)), 4), dtype=np.int32)
+        buf = self._rect_buf[:n]
+        if n:
+            buf[:] = [
+                (r.left, r.top, r.right, r.bottom)
+                for r in [p.next_rect for p in proposals]
+            ]
+        return buf
+
     def _resolve_pairwise(self, proposals: List[MoveProposal]) -> None:
         """
-        For every pair of proposals that would overlap (including safe margin),
-        reject the one with lower priority. On tie, reject the higher-ID vehicle.
+        Greedy first-fit in priority order: walk proposals from highest
+        priority to lowest (ties → lower ID first) and reject any whose
+        inflated rect overlaps one already accepted. A rejected proposal
+        therefore never blocks anyone else. collision_count grows by one per
+        conflicting pair, i.e. per accepted proposal the loser overlaps.
         """
-        n = len(proposals)
         margin = COLLISION_SAFE_MARGIN
-
-        for i in range(n):
-            if not proposals[i].approved:
+        # grid cell → [(proposal, inflated rect)] of accepted proposals
+        placed: dict = {}
+
+        ranked = sorted(
+            (p for p in proposals if p.approved),
+            key=lambda p: (-p.priority, p.vehicle.id),
+        )
+        for p in ranked:
+            rect = inflate_rect(p.next_rect, margin)
+            cells = grid_cells(rect)
+            # Vehicle rects are never empty, so pygame's C colliderect gives
+            # the same answer as aabb_overlap without the Python-level compares
+            collides = rect.colliderect
+            # Every accepted proposal this one overlaps counts as a conflict
+            # (a rect sits in several cells, so dedupe by vehicle id)
+            hits = {
+                q.vehicle.id
+                for c in cells for q, q_rect in placed.get(c, ()) if collides(q_rect)
+            }
+            if hits:
+                self._collision_count += len(hits)
+                p.approved = False
+                logger.debug(
+                    "Collision: V%d vs %s → V%d rejected",
+                    p.vehicle.id, sorted(hits), p.vehicle.id,
+                )
                 continue
-            for j in range(i + 1, n):
-                if not proposals[j].approved:
-                    continue
-
-                pi, pj = proposals[i], proposals[j]
-
-                # Skip if both vehicles are in the same lane and one is behind
-                # the other — the in-lane following logic already handles this.
-                # We still check to catch edge cases.
-
-                if aabb_overlap(
-                    inflate_rect(pi.next_rect, margin),
-                    inflate_rect(pj.next_rect, margin),
-                ):
-                    self._collision_count += 1
-                    loser = self._pick_loser(pi, pj)
-                    loser.approved = False
-                    logger.debug(
-                        "Collision: V%d vs V%d → V%d rejected",
-                        pi.vehicle.id, pj.vehicle.id, loser.vehicle.id,
-                    )
-                    if loser is pi:
-                        break
-
-    def _resolve_against_rejected(self, proposals: List[MoveProposal]) -> None:
+            for c in cells:
+                placed.setdefault(c, []).append((p, rect))
+
+    def _resolve_against_rejected(
+        self,
+        proposals: List[MoveProposal],
+        rects: np.ndarray,
+    ) -> None:
         """
         Check each approved proposal's next_rect against the CURRENT rect
         of every rejected vehicle (which stays in place).
 
+        *rects* holds the proposals' next_rect edges from _fill_rect_buf.
         Iterates up to 3 rounds to handle cascading rejections.
         """
         margin = COLLISION_SAFE_MARGIN
+        px1 = rects[:, 0, None] - margin
+        py1 = rects[:, 1, None] - margin
+        px2 = rects[:, 2, None] + margin
+        py2 = rects[:, 3, None] + margin
+        approved = np.fromiter(
+            (p.approved for p in proposals), dtype=bool, count=len(proposals),
+        )
 
         for _round in range(3):
-            changed = False
-            rejected_rects = [
-                (p.vehicle.rect, p.vehicle.id)
-                for p in proposals if not p.approved
-            ]
-            if not rejected_rects:
+            rejected = [p.vehicle for p in proposals if not p.approved]
+            if not rejected:
                 break
 
-            for p in proposals:
-                if not p.approved:
-                    continue
-                for (rej_rect, rej_id) in rejected_rects:
-                    if aabb_overlap(
-                        inflate_rect(p.next_rect, margin),
-                        inflate_rect(rej_rect, margin),
-                    ):
-                        p.approved = False
-                        self._collision_count += 1
-                        changed = True
-                        logger.debug(
-                            "Rejected-current conflict: V%d proposed rect "
-                            "overlaps V%d current rect → V%d rejected",
-                            p.vehicle.id, rej_id, p.vehicle.id,
-                        )
-                        break  # vehicle already rejected, move to next
-
-            if not changed:
+            # Rejected vehicles' current rects, inflated: (x, y, w, h) columns
+            cur = np.array([tuple(v.rect) for v in rejected], dtype=np.int32)
+            hits = (
+                (px1 < cur[:, 0] + cur[:, 2] + margin)
+                & (px2 > cur[:, 0] - margin)
+                & (py1 < cur[:, 1] + cur[:, 3] + margin)
+                & (py2 > cur[:, 1] - margin)
+            )
+            newly = approved & hits.any(axis=1)
+            if not newly.any():
                 break
 
+            for i in np.flatnonzero(newly):
+                p = proposals[i]
+                p.approved = False
+                self._collision_count += 1
+                logger.debug(
+                    "Rejected-current conflict: V%d proposed rect "
+                    "overlaps V%d current rect → V%d rejected",
+                    p.vehicle.id, rejected[hits[i].argmax()].id, p.vehicle.id,
+                )
+            approved &= ~newly
+
     def _enforce_intersection_cap(
         self,
         proposals: List[MoveProposal],
@@ -257,10 +404,11 @@ class CollisionManager:
         """
         # Collect proposals whose next_rect overlaps the intersection
         in_zone: List[MoveProposal] = []
+        in_box = intersection_rect.colliderect
         for p in proposals:
             if not p.approved:
                 continue
-            if aabb_overlap(p.next_rect, intersection_rect):
+            if in_box(p.next_rect):
                 in_zone.append(p)
 
         if len(in_zone) <= INTERSECTION_MAX_OCCUPANTS:
@@ -278,14 +426,6 @@ class CollisionManager:
                 p.vehicle.id, p.priority,
             )
 
-    @staticmethod
-    def _pick_loser(a: MoveProposal, b: MoveProposal) -> MoveProposal:
-        """Deterministic conflict resolution: lower priority loses; ties → higher ID loses."""
-        if a.priority != b.priority:
-            return a if a.priority < b.priority else b
-        # Tie-break: higher ID yields (preserves first-come ordering)
-        return a if a.vehicle.id > b.vehicle.id else b
-
     # ── post-commit verification ──────────────
 
     @staticmethod
@@ -294,27 +434,18 @@ class CollisionManager:
         Debug assertion: verifies that NO two vehicles currently overlap.
         Call after all commits. Disabled when COLLISION_DEBUG_ASSERTIONS is False.
         """
-        if not COLLISION_DEBUG_ASSERTIONS:
+        if not COLLISION_DEBUG_ASSERTIONS or len(vehicles) < 2:
             return
-        n = len(vehicles)
-        for i in range(n):
-            for j in range(i + 1, n):
-                if aabb_overlap(vehicles[i].rect, vehicles[j].rect):
-                    logger.error(
-                        "OVERLAP DETECTED after commit: V%d %s  vs  V%d %s",
-                        vehicles[i].id, vehicles[i].rect,
-                        vehicles[j].id, vehicles[j].rect,
-                    )
-                    # Don't hard-crash training; log and continue
-                    # In tests, you can assert False here.
+        for i, j in overlap_pairs(rect_edges(vehicles)):
+            logger.error(
+                "OVERLAP DETECTED after commit: V%d %s  vs  V%d %s",
+                vehicles[i].id, vehicles[i].rect,
+                vehicles[j].id, vehicles[j].rect,
+            )
+            # Don't hard-crash training; log and continue
+            # In tests, you can assert False here.
 
     @staticmethod
     def count_current_overlaps(vehicles: list) -> int:
         """Return the number of overlapping vehicle pairs (for metrics)."""
-        count = 0
-        n = len(vehicles)
-        for i in range(n):
-            for j in range(i + 1, n):
-                if aabb_overlap(vehicles[i].rect, vehicles[j].rect):
-                    count += 1
-        return count
+        return count_overlaps(rect_edges(vehicles))
@@ -25,7 +25,7 @@ from config.settings import (
 )
 from simulation.road_network import Intersection
 from simulation.vehicle import VehicleSpawner, VehicleState
-from simulation.traffic_light import TrafficLightController, TrafficLightState
+from simulation.traffic_light import TrafficLightController
 from simulation.collision import CollisionManager
 
 
@@ -114,18 +114,15 @@ class TrafficEnvironment:
         return self._build_state()
 
     # ─── collision-aware update for one frame ──
-    def _update_vehicles_one_frame(self, light_states: dict) -> int:
+    def _update_vehicles_one_frame(self, light_flags: dict) -> int:
         """
         Two-phase vehicle update with collision detection.
+        *light_flags* comes from TrafficLightController.get_light_flags().
 
         Returns the number of collisions detected this frame.
         """
         # Phase 1: All vehicles propose their next position
-        proposals = []
-        for v in self.vehicles:
-            is_green = light_states[v.direction] == TrafficLightState.GREEN
-            is_yellow = light_states[v.direction] == TrafficLightState.YELLOW
-            proposals.append(v.propose_move(is_green, is_yellow))
+        proposals = [v.propose_move(*light_flags[v.direction]) for v in self.vehicles]
 
         # Phase 2: CollisionManager validates all proposals simultaneously
         approved, rejected = self.collision_mgr.validate_all(
@@ -162,7 +159,8 @@ class TrafficEnvironment:
             reward += PENALTY_SWITCH
         self.prev_action = action
 
-        light_states = self.controller.get_state()
+        light_flags = self.controller.get_light_flags()
+        waiting = VehicleState.WAITING  # IntEnum: compares as a plain int
 
         for _ in range(DECISION_INTERVAL):
             self.total_steps += 1
@@ -171,7 +169,7 @@ class TrafficEnvironment:
             self.spawner.try_spawn_all_directions(self.vehicles)
 
             # Collision-aware two-phase update
-            frame_collisions = self._update_vehicles_one_frame(light_states)
+            frame_collisions = self._update_vehicles_one_frame(light_flags)
             total_collisions += frame_collisions
 
             # Remove crossed vehicles
@@ -180,13 +178,12 @@ class TrafficEnvironment:
                 reward += REWARD_CAR_PASSED
                 passed_this_step += 1
                 self.total_passed += 1
-                if v in v.lane.vehicles:
-                    v.lane.vehicles.remove(v)
+                v.lane.remove_vehicle(v)
                 self.vehicles.remove(v)
 
             # Penalties
             for v in self.vehicles:
-                if v.state == VehicleState.WAITING:
+                if v.state == waiting:
                     reward += PENALTY_CAR_WAITING
                     if v.wait_time > LONG_WAIT_THRESHOLD:
                         reward += PENALTY_LONG_WAIT
@@ -200,13 +197,13 @@ class TrafficEnvironment:
 
         done = self.total_steps >= MAX_EPISODE_STEPS
 
-        waits = [v.wait_time for v in self.vehicles if v.state == VehicleState.WAITING]
+        waits = [v.wait_time for v in self.vehicles if v.state == waiting]
         avg_wait = float(np.mean(waits)) if waits else 0.0
 
         info = {
             "throughput": passed_this_step,
             "avg_wait": avg_wait,
-            "total_waiting": sum(1 for v in self.vehicles if v.state == VehicleState.WAITING),
+            "total_waiting": len(waits),
             "total_passed": self.total_passed,
             "collisions": total_collisions,
         }
@@ -234,8 +231,8 @@ class TrafficEnvironment:
                          (cx - 80, 0, 160, SCREEN_HEIGHT))
 
         # Draw vehicles
-        for v in self.vehicles:
-            v.draw(self.screen)
+        self.screen.blits([(v.sprite, v.rect) for v in self.vehicles],
+                          doreturn=False)
 
         # Draw lights
         self.controller.draw(self.screen)
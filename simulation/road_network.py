@@ -3,6 +3,8 @@ Traffic-Mind – Road Network
 Defines Lane, Road, and Intersection for a single 4-way crossing.
 """
 
+from collections import deque
+
 import pygame
 from config.settings import (
     Direction,
@@ -27,7 +29,10 @@ class Lane:
         """
         self.direction = direction
         self.lane_index = lane_index
-        self.vehicles = []
+        # True when traffic moves along the y axis (N/S), False for x (E/W)
+        self.axis_y = direction in (Direction.NORTH, Direction.SOUTH)
+        # FIFO: vehicles enter at the tail and leave from the head
+        self.vehicles = deque()
 
         # Compute spawn, stop-line, and despawn positions
         self.start_pos = (0, 0)
@@ -73,6 +78,26 @@ class Lane:
             self.stop_line_pos = (INTERSECTION_RIGHT, y)
             self.end_pos = (-20, y)
 
+    def add_vehicle(self, vehicle) -> None:
+        """Queue *vehicle* at the tail, behind the current last vehicle."""
+        vehicle.leader = self.vehicles[-1] if self.vehicles else None
+        self.vehicles.append(vehicle)
+
+    def remove_vehicle(self, vehicle) -> None:
+        """Drop *vehicle* from this lane (O(1) when it is the lead vehicle)."""
+        vehicles = self.vehicles
+        if vehicles and vehicles[0] is vehicle:
+            vehicles.popleft()
+            i = 0
+        elif vehicle in vehicles:
+            i = vehicles.index(vehicle)
+            del vehicles[i]
+        else:
+            return
+        # Its follower now follows whoever it was following
+        if i < len(vehicles) and vehicles[i].leader is vehicle:
+            vehicles[i].leader = vehicle.leader
+
     def __repr__(self):
         return f"Lane({self.direction.name}, idx={self.lane_index})"
 
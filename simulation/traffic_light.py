@@ -16,6 +16,11 @@ from config.settings import (
 )
 
 
+# Signal head geometry (pixels)
+HOUSING_W, HOUSING_H = 22, 60
+LIGHT_SPACING = 16
+
+
 class TrafficLightState(Enum):
     RED = "RED"
     YELLOW = "YELLOW"
@@ -59,11 +64,22 @@ class TrafficLight:
     def is_yellow(self) -> bool:
         return self.state == TrafficLightState.YELLOW
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Screen area draw() can touch: the housing plus the active glow."""
+        px, py = self.position
+        glow = LIGHT_RADIUS * 2
+        housing = pygame.Rect(px - HOUSING_W // 2, py - HOUSING_H // 2, HOUSING_W, HOUSING_H)
+        return housing.union(pygame.Rect(
+            px - glow, py - LIGHT_SPACING - glow,
+            2 * glow, 2 * (LIGHT_SPACING + glow),
+        ))
+
     def draw(self, screen: pygame.Surface):
         px, py = self.position
 
         # Housing
-        housing_w, housing_h = 22, 60
+        housing_w, housing_h = HOUSING_W, HOUSING_H
         housing_rect = pygame.Rect(
             px - housing_w // 2, py - housing_h // 2,
             housing_w, housing_h,
@@ -72,7 +88,7 @@ class TrafficLight:
         pygame.draw.rect(screen, (60, 60, 60), housing_rect, width=1, border_radius=6)
 
         # Three lights
-        spacing = 16
+        spacing = LIGHT_SPACING
         for i, (state_enum, bright, dim) in enumerate([
             (TrafficLightState.RED, LIGHT_RED, LIGHT_RED_DIM),
             (TrafficLightState.YELLOW, LIGHT_YELLOW, LIGHT_YELLOW_DIM),
@@ -136,6 +152,10 @@ class TrafficLightController:
         """Return dict direction → TrafficLightState."""
         return {d: self.lights[d].state for d in Direction}
 
+    def get_light_flags(self):
+        """Return dict direction → (is_green, is_yellow), as propose_move takes them."""
+        return {d: (light.is_green(), light.is_yellow()) for d, light in self.lights.items()}
+
     def get_phase_info(self) -> str:
         names = {
             self.PHASE_NS_GREEN: "N-S Green",
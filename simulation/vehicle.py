@@ -3,8 +3,9 @@ Traffic-Mind – Vehicle Simulation
 Vehicle class with two-phase update and collision-aware movement.
 """
 
-import random
-from enum import Enum
+import itertools
+from enum import IntEnum
+import numpy as np
 import pygame
 
 from config.settings import (
@@ -27,17 +28,24 @@ from config.settings import (
     INTERSECTION_TOP,
     INTERSECTION_BOTTOM,
 )
+from simulation.collision import MoveProposal
 
 
 # ═══════════════════════════════════════════════
 # Vehicle State Enum
 # ═══════════════════════════════════════════════
 
-class VehicleState(Enum):
-    """Tracks vehicle's current behavior."""
-    WAITING = "WAITING"      # Stopped at red light or behind another car
-    MOVING = "MOVING"        # Driving normally
-    CROSSING = "CROSSING"    # Currently inside intersection
+class VehicleState(IntEnum):
+    """Tracks vehicle's current behavior (int-valued: compares as plain ints)."""
+    WAITING = 0      # Stopped at red light or behind another car
+    MOVING = 1       # Driving normally
+    CROSSING = 2     # Currently inside intersection
+
+
+# Module-level aliases for the per-frame paths below
+_WAITING = VehicleState.WAITING
+_MOVING = VehicleState.MOVING
+_CROSSING = VehicleState.CROSSING
 
 
 # ═══════════════════════════════════════════════
@@ -45,7 +53,48 @@ class VehicleState(Enum):
 # ═══════════════════════════════════════════════
 
 # Global vehicle ID counter
-_vehicle_id_counter = 0
+_vehicle_ids = itertools.count()
+
+# Following-distance thresholds used by propose_move
+_FOLLOW_DISTANCE = SAFE_DISTANCE * 2        # start reacting to the car ahead
+_HARD_STOP_DISTANCE = SAFE_DISTANCE * 0.1   # stop outright to avoid rear-ending
+
+# Random draws are pre-generated in batches of this many (as plain Python values)
+_LOOK_BATCH = 1024
+_RAND_BATCH = 4096
+
+
+def _car_looks(rng: np.random.Generator, n: int = _LOOK_BATCH):
+    """Endless (max_speed, color) pairs for regular cars, drawn *n* at a time."""
+    n_colors = len(CAR_COLORS)
+    while True:
+        speeds = rng.uniform(CAR_SPEED_MIN, CAR_SPEED_MAX, n).tolist()
+        colors = rng.integers(0, n_colors, n).tolist()
+        for speed, c in zip(speeds, colors):
+            yield speed, CAR_COLORS[c]
+
+
+def _uniforms(rng: np.random.Generator, n: int = _RAND_BATCH):
+    """Endless uniform [0, 1) samples, drawn *n* at a time."""
+    while True:
+        yield from rng.random(n).tolist()
+
+
+_next_car_look = _car_looks(np.random.default_rng()).__next__
+
+# Vehicle.leader of a vehicle that was not queued through Lane.add_vehicle
+_UNLINKED = object()
+
+# Height of the intersection box a vehicle must clear before entering
+INTERSECTION_SPAN = INTERSECTION_BOTTOM - INTERSECTION_TOP
+
+# Unit travel vector (dx, dy) per direction — screen y grows downward
+_DIR_VEC = {
+    Direction.NORTH: (0, -1),
+    Direction.SOUTH: (0, 1),
+    Direction.EAST: (1, 0),
+    Direction.WEST: (-1, 0),
+}
 
 
 class Vehicle:
@@ -56,6 +105,16 @@ class Vehicle:
         3. reject_move() — reject proposal, stop vehicle
     """
 
+    __slots__ = (
+        "id", "direction", "lane", "x", "y", "is_emergency",
+        "max_speed", "speed", "state",
+        "width", "height", "half_w", "half_h",
+        "color", "rect", "wait_time", "total_time",
+        "leader", "_stripe", "_sprite", "_next_rect", "_proposal",
+        "_dx", "_dy", "_axis_y", "_sign", "_half_len",
+        "_required_clearance", "_stop_coord", "_end_coord",
+    )
+
     def __init__(self, direction: Direction, lane, x: float, y: float, is_emergency: bool = False):
         """
         Create a vehicle at a specific position.
@@ -67,9 +126,7 @@ class Vehicle:
             y: Initial y position
             is_emergency: Whether this is an emergency vehicle
         """
-        global _vehicle_id_counter
-        self.id = _vehicle_id_counter
-        _vehicle_id_counter += 1
+        self.id = next(_vehicle_ids)
 
         self.direction = direction
         self.lane = lane
@@ -77,15 +134,15 @@ class Vehicle:
         self.y = float(y)
         self.is_emergency = is_emergency
 
-        # Speed and state
+        # Speed, state and colour
         if is_emergency:
             self.max_speed = EMERGENCY_SPEED
-            self.speed = EMERGENCY_SPEED
+            self.color = EMERGENCY_COLOR
         else:
-            self.max_speed = random.uniform(CAR_SPEED_MIN, CAR_SPEED_MAX)
-            self.speed = self.max_speed
+            self.max_speed, self.color = _next_car_look()
+        self.speed = self.max_speed
         
-        self.state = VehicleState.MOVING
+        self.state = _MOVING
 
         # Dimensions (swap for E/W vehicles)
         if direction in (Direction.NORTH, Direction.SOUTH):
@@ -95,20 +152,50 @@ class Vehicle:
             self.width = CAR_LENGTH
             self.height = CAR_WIDTH
 
-        # Visual appearance
+        self.half_w = self.width * 0.5
+        self.half_h = self.height * 0.5
+
+        # Emergency stripe as (dx, dy, w, h) relative to the rect; None otherwise
+        self._stripe = None
         if is_emergency:
-            self.color = EMERGENCY_COLOR
-        else:
-            self.color = random.choice(CAR_COLORS)
+            MIN_STRIPE_WIDTH = 3
+            stripe_width = max(MIN_STRIPE_WIDTH, self.width // 4)
+            if direction in (Direction.NORTH, Direction.SOUTH):
+                self._stripe = ((self.width - stripe_width) // 2, 0, stripe_width, self.height)
+            else:
+                self._stripe = (0, (self.height - stripe_width) // 2, self.width, stripe_width)
+
+        self._sprite = None     # resolved from _sprite_cache on first draw
+
+        # Vehicle directly ahead in the lane (None at the head); set by
+        # Lane.add_vehicle. Vehicles put in a lane any other way stay unlinked.
+        self.leader = _UNLINKED
+
+        # Travel geometry (lane is fixed for life). _sign is +1 when the
+        # vehicle moves toward increasing x/y (S, E), -1 otherwise.
+        self._dx, self._dy = _DIR_VEC[direction]
+        self._axis_y = self._dx == 0
+        self._half_len = self.half_h if self._axis_y else self.half_w
+        # Free space needed ahead before entering the box (don't block it)
+        self._required_clearance = INTERSECTION_SPAN + self.height + SAFE_DISTANCE
+        self._sign = self._dx + self._dy
+        sx, sy = lane.stop_line_pos
+        self._stop_coord = sy if self._axis_y else sx
+        ex, ey = lane.end_pos
+        self._end_coord = ey if self._axis_y else ex
 
         # Collision rect
         self.rect = pygame.Rect(
-            int(self.x - self.width / 2),
-            int(self.y - self.height / 2),
+            int(self.x - self.half_w),
+            int(self.y - self.half_h),
             self.width,
             self.height,
         )
 
+        # Reused by propose_move every frame (a proposal only lives for one frame)
+        self._next_rect = pygame.Rect(self.rect)
+        self._proposal = None
+
         # Metrics
         self.wait_time = 0      # frames spent waiting
         self.total_time = 0     # total frames alive
@@ -121,52 +208,63 @@ class Vehicle:
         """
         Phase 1: Calculate the next position / speed WITHOUT modifying state.
 
-        Returns a MoveProposal (imported from simulation.collision).
+        Returns a MoveProposal (see simulation.collision). The
+        proposal and its rect are reused on the next call, so consume it
+        within the frame.
         """
-        from simulation.collision import MoveProposal
 
         # Start from current position
         next_x = self.x
         next_y = self.y
-        next_speed = self.speed
+        speed = self.speed
+        max_speed = self.max_speed
+        next_speed = speed
         next_state = self.state
 
         self.total_time += 1
 
-        dist_stop = self._distance_to_stop_line()
-        front_dist = self.check_front_vehicle(self.lane.vehicles)
+        # Front bumper to stop line along the travel axis (negative once past it)
+        dist_stop = self._sign * (self._stop_coord - (next_y if self._axis_y else next_x)) - self._half_len
+        front_dist = self._lane_front_gap()
+        # Evaluated once and shared by the light, jam-buster and state checks
+        in_zone = (
+            INTERSECTION_LEFT <= next_x <= INTERSECTION_RIGHT
+            and INTERSECTION_TOP <= next_y <= INTERSECTION_BOTTOM
+        )
+        before_stop_line = dist_stop >= 0 and not in_zone
 
         # ── Follow car ahead (smooth deceleration) ──
         should_stop = False
 
-        if front_dist is not None and front_dist < SAFE_DISTANCE * 2:
-            if front_dist <= SAFE_DISTANCE * 0.1:
+        if front_dist is not None and front_dist < _FOLLOW_DISTANCE:
+            if front_dist <= _HARD_STOP_DISTANCE:
                 # Extremely close — hard stop to avoid rear-end collision
                 next_speed = 0
-                next_state = VehicleState.WAITING
+                next_state = _WAITING
                 should_stop = True
             elif front_dist <= SAFE_DISTANCE:
                 # Within safe distance — match speed proportionally
-                ratio = max(0.0, front_dist / SAFE_DISTANCE)
+                # front_dist > _HARD_STOP_DISTANCE here, so ratio is already positive
+                ratio = front_dist / SAFE_DISTANCE
                 # If currently stopped (speed=0), give a kick-start when there's room
-                if self.speed == 0 and ratio > RESUME_THRESHOLD:
-                    next_speed = self.max_speed * ratio * RESUME_SPEED_FACTOR
+                if speed == 0 and ratio > RESUME_THRESHOLD:
+                    next_speed = max_speed * ratio * RESUME_SPEED_FACTOR
                 else:
                     # Smooth linear deceleration — don't compound with current speed
-                    next_speed = self.max_speed * ratio * 0.8
+                    next_speed = max_speed * ratio * 0.8
                 if next_speed < 0.05:
                     next_speed = 0
-                    next_state = VehicleState.WAITING
+                    next_state = _WAITING
                     should_stop = True
             else:
                 # Approaching safe distance — gentle deceleration
                 ratio = (front_dist - SAFE_DISTANCE) / SAFE_DISTANCE
-                target_speed = self.max_speed * min(1.0, ratio)
+                target_speed = max_speed * min(1.0, ratio)
                 next_speed = max(target_speed, next_speed * 0.9)
 
         # ── Red / yellow light behaviour ──
         slowing_for_light = False
-        if not should_stop and not self._past_stop_line() and not self._in_intersection_zone():
+        if not should_stop and before_stop_line:
             if not light_is_green:
                 slowing_for_light = True
                 if light_is_yellow and dist_stop < 40:
@@ -175,11 +273,11 @@ class Vehicle:
                     pass
                 elif dist_stop < 80:
                     # Decelerate as we approach
-                    decel = max(0.1, dist_stop / 80) * self.max_speed
+                    decel = max(0.1, dist_stop / 80) * max_speed
                     next_speed = max(0, min(next_speed, decel))
                     if dist_stop < 5:
                         next_speed = 0
-                        next_state = VehicleState.WAITING
+                        next_state = _WAITING
                         should_stop = True
             
             # ── DON'T BLOCK THE BOX ──
@@ -187,32 +285,30 @@ class Vehicle:
             elif light_is_green and dist_stop < 20:
                 # We are about to enter the intersection. Check if there is space on the other side.
                 # Intersection span is typically ~160px. We want at least (Intersection + Car + Margin) clear.
-                required_clearance = (INTERSECTION_BOTTOM - INTERSECTION_TOP) + self.height + SAFE_DISTANCE
-                
-                if front_dist is not None and front_dist < required_clearance:
+                if front_dist is not None and front_dist < self._required_clearance:
                     # The car ahead is blocking the exit or is just inside the intersection.
                     # Stop here to keep the intersection clear for cross traffic.
                     next_speed = 0
-                    next_state = VehicleState.WAITING
+                    next_state = _WAITING
                     should_stop = True
 
         # ── JAM BUSTER FAILSAFE ──
         # If vehicle has been waiting too long but path seems clear (no car ahead), force resume.
-        if self.state == VehicleState.WAITING and self.wait_time > 150:
+        if self.state == _WAITING and self.wait_time > 150:
             # 150 frames = 2.5 seconds (Faster recovery)
             # from config.settings import SAFE_DISTANCE, KICKSTART_SPEED  <-- REMOVED
-            dist_to_front = self.check_front_vehicle(self.lane.vehicles)
+            dist_to_front = front_dist
             
             # If no car ahead OR car ahead is far away
-            if dist_to_front is None or dist_to_front > SAFE_DISTANCE * 2:
+            if dist_to_front is None or dist_to_front > _FOLLOW_DISTANCE:
                 # But check if we are stopped at a RED light
-                if not light_is_green and not self._past_stop_line() and not self._in_intersection_zone() and dist_stop < 10:
+                if not light_is_green and before_stop_line and dist_stop < 10:
                     # Correctly stopped at red light — do nothing
                     pass
                 else:
                     # We are stuck for no good reason (phantom jam) -> Force move
                     should_stop = False
-                    next_state = VehicleState.MOVING
+                    next_state = _MOVING
                     next_speed = KICKSTART_SPEED
                     # Reset wait time so we don't trigger this every frame if it persists
                     self.wait_time = 0
@@ -220,51 +316,51 @@ class Vehicle:
         # ── Accelerate toward max speed ──
         # FIX: If stopped and no obstacles, give a stronger initial acceleration
         # Only accelerate if we are NOT intentionally slowing for a red light
-        if not should_stop and not slowing_for_light and next_speed < self.max_speed:
-            if self.speed == 0 and next_speed == 0:
+        if not should_stop and not slowing_for_light and next_speed < max_speed:
+            if speed == 0 and next_speed == 0:
                 # Vehicle was stopped and no immediate obstacles — resume with stronger kick
-                next_speed = min(self.max_speed, KICKSTART_SPEED)
+                next_speed = min(max_speed, KICKSTART_SPEED)
             else:
-                next_speed = min(self.max_speed, next_speed + ACCELERATION_RATE)
+                next_speed = min(max_speed, next_speed + ACCELERATION_RATE)
 
         # ── Determine state ──
         if should_stop or next_speed <= 0:
             next_speed = 0
-            next_state = VehicleState.WAITING
-        elif self._pos_in_intersection(next_x, next_y):
-            next_state = VehicleState.CROSSING
+            next_state = _WAITING
+        elif in_zone:
+            next_state = _CROSSING
         else:
-            next_state = VehicleState.MOVING
+            next_state = _MOVING
 
         # ── Compute proposed position ──
         if next_speed > 0:
-            if self.direction == Direction.NORTH:
-                next_y -= next_speed
-            elif self.direction == Direction.SOUTH:
-                next_y += next_speed
-            elif self.direction == Direction.EAST:
-                next_x += next_speed
-            elif self.direction == Direction.WEST:
-                next_x -= next_speed
-
-        # Build the proposed rect
-        next_rect = pygame.Rect(
-            int(next_x - self.width / 2),
-            int(next_y - self.height / 2),
-            self.width,
-            self.height,
-        )
+            next_x += self._dx * next_speed
+            next_y += self._dy * next_speed
+
+        # Update the proposed rect in place
+        next_rect = self._next_rect
+        next_rect.x = int(next_x - self.half_w)
+        next_rect.y = int(next_y - self.half_h)
 
         # Return proposal (priority will be computed by CollisionManager)
-        return MoveProposal(
-            vehicle=self,
-            next_x=next_x,
-            next_y=next_y,
-            next_speed=next_speed,
-            next_state=next_state,
-            next_rect=next_rect,
-            approved=True,
-        )
+        proposal = self._proposal
+        if proposal is None:
+            proposal = self._proposal = MoveProposal(
+                vehicle=self,
+                next_x=next_x,
+                next_y=next_y,
+                next_speed=next_speed,
+                next_state=next_state,
+                next_rect=next_rect,
+                approved=True,
+            )
+        else:
+            proposal.next_x = next_x
+            proposal.next_y = next_y
+            proposal.next_speed = next_speed
+            proposal.next_state = next_state
+            proposal.approved = True
+        return proposal
 
     def commit_move(self, proposal):
         """
@@ -277,7 +373,7 @@ class Vehicle:
         self._update_rect()
 
         # Update metrics
-        if self.state == VehicleState.WAITING:
+        if self.state == _WAITING:
             self.wait_time += 1
         else:
             self.wait_time = 0
@@ -287,7 +383,7 @@ class Vehicle:
         Phase 2 (alternative): Reject the proposal, vehicle stops in place.
         """
         self.speed = 0
-        self.state = VehicleState.WAITING
+        self.state = _WAITING
         self.wait_time += 1
 
     # ────────────────────────────────────────────
@@ -300,124 +396,108 @@ class Vehicle:
         
         Distance is measured from the front of this vehicle to the back of the front vehicle.
         """
+        # Project onto the travel axis so "ahead" is always a larger value
+        my_id = self.id
+        axis_y = self._axis_y
+        sign = self._sign
+        my_pos = sign * (self.y if axis_y else self.x)
+        my_front = my_pos + self._half_len
+
         min_dist = None
         for other in vehicles:
-            if other.id == self.id:
+            if other.id == my_id:
                 continue
-
-            # Check if other is ahead in the same lane
-            if self.direction == Direction.NORTH:
-                if other.y < self.y:
-                    # other is ahead (lower y)
-                    # Distance = (my y - my half-height) - (other y + other half-height)
-                    dist = (self.y - self.height / 2) - (other.y + other.height / 2)
-                    if dist >= 0:
-                        if min_dist is None or dist < min_dist:
-                            min_dist = dist
-            elif self.direction == Direction.SOUTH:
-                if other.y > self.y:
-                    dist = (other.y - other.height / 2) - (self.y + self.height / 2)
-                    if dist >= 0:
-                        if min_dist is None or dist < min_dist:
-                            min_dist = dist
-            elif self.direction == Direction.EAST:
-                if other.x > self.x:
-                    dist = (other.x - other.width / 2) - (self.x + self.width / 2)
-                    if dist >= 0:
-                        if min_dist is None or dist < min_dist:
-                            min_dist = dist
-            elif self.direction == Direction.WEST:
-                if other.x < self.x:
-                    dist = (self.x - self.width / 2) - (other.x + other.width / 2)
-                    if dist >= 0:
-                        if min_dist is None or dist < min_dist:
-                            min_dist = dist
-
+            other_pos = sign * (other.y if axis_y else other.x)
+            if other_pos > my_pos:
+                dist = (other_pos - (other.half_h if axis_y else other.half_w)) - my_front
+                if dist >= 0 and (min_dist is None or dist < min_dist):
+                    min_dist = dist
         return min_dist
 
-    def _distance_to_stop_line(self) -> float:
-        """Return distance from front of vehicle to the stop line."""
-        sx, sy = self.lane.stop_line_pos
-
-        if self.direction == Direction.NORTH:
-            return (self.y - self.height / 2) - sy
-        elif self.direction == Direction.SOUTH:
-            return sy - (self.y + self.height / 2)
-        elif self.direction == Direction.EAST:
-            return sx - (self.x + self.width / 2)
-        elif self.direction == Direction.WEST:
-            return (self.x - self.width / 2) - sx
-        return 0.0
-
-    def _past_stop_line(self) -> bool:
-        """Return True if the vehicle has crossed the stop line."""
-        return self._distance_to_stop_line() < 0
-
-    def _in_intersection_zone(self) -> bool:
-        """Return True if vehicle's center is inside the intersection."""
-        return self._pos_in_intersection(self.x, self.y)
-
-    def _pos_in_intersection(self, x: float, y: float) -> bool:
-        """Return True if given position is inside the intersection."""
-        return (
-            INTERSECTION_LEFT <= x <= INTERSECTION_RIGHT
-            and INTERSECTION_TOP <= y <= INTERSECTION_BOTTOM
-        )
+    def _lane_front_gap(self):
+        """
+        Like check_front_vehicle(self.lane.vehicles), but O(1).
+
+        Lanes are FIFO and vehicles never overtake, so the vehicle ahead is
+        the one this vehicle was queued behind (``leader``, maintained by
+        Lane.add_vehicle / Lane.remove_vehicle). Walking further along the
+        chain is only needed if the leader is (erroneously) overlapping us.
+        Unlinked vehicles, and links that turn out not to point ahead, use
+        the full scan.
+        """
+        other = self.leader
+        axis_y = self._axis_y
+        sign = self._sign
+        my_pos = sign * (self.y if axis_y else self.x)
+        my_front = my_pos + self._half_len
+        while other is not None:
+            if other is _UNLINKED:
+                return self.check_front_vehicle(self.lane.vehicles)
+            assert other.lane is self.lane, "leader link crosses lanes"
+            other_pos = sign * (other.y if axis_y else other.x)
+            if other_pos <= my_pos:
+                # Lane order violated (e.g. vehicles moved by hand)
+                return self.check_front_vehicle(self.lane.vehicles)
+            dist = (other_pos - other._half_len) - my_front
+            if dist >= 0:
+                return dist
+            other = other.leader
+        return None
 
     def _update_rect(self):
         """Update collision rect to match current position."""
-        self.rect.x = int(self.x - self.width / 2)
-        self.rect.y = int(self.y - self.height / 2)
-        self.rect.width = self.width
-        self.rect.height = self.height
+        # Size is fixed at construction; only the position moves
+        rect = self.rect
+        rect.x = int(self.x - self.half_w)
+        rect.y = int(self.y - self.half_h)
 
     def has_crossed(self) -> bool:
         """Return True if the vehicle has left the visible area (despawned)."""
-        sx, sy = self.lane.end_pos
-        
+        pos = self.y if self._axis_y else self.x
         # Check if vehicle has reached the despawn position
-        if self.direction == Direction.NORTH:
-            return self.y < sy
-        elif self.direction == Direction.SOUTH:
-            return self.y > sy
-        elif self.direction == Direction.EAST:
-            return self.x > sx
-        elif self.direction == Direction.WEST:
-            return self.x < sx
-        return False
+        return self._sign * (pos - self._end_coord) > 0
 
     # ────────────────────────────────────────────
     # Rendering
     # ────────────────────────────────────────────
 
+    # Pre-rendered sprites keyed by (color, width, height, is_emergency);
+    # shared by every vehicle with the same look.
+    _sprite_cache: dict = {}
+
+    def _get_sprite(self) -> pygame.Surface:
+        """Return (building once) the cached sprite for this vehicle's look."""
+        key = (self.color, self.width, self.height, self.is_emergency)
+        sprite = Vehicle._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            body = sprite.get_rect()
+            pygame.draw.rect(sprite, self.color, body, border_radius=3)
+
+            # Emergency vehicles get a stripe
+            if self._stripe is not None:
+                pygame.draw.rect(sprite, EMERGENCY_STRIPE_COLOR, self._stripe)
+
+            # Border for definition
+            border_color = tuple(max(0, c - 40) for c in self.color)
+            pygame.draw.rect(sprite, border_color, body, width=1, border_radius=3)
+            # Match the display's pixel format when there is one (headless tests have none)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            Vehicle._sprite_cache[key] = sprite
+        return sprite
+
+    @property
+    def sprite(self) -> pygame.Surface:
+        """Pre-rendered surface for this vehicle (see ``_get_sprite``)."""
+        sprite = self._sprite
+        if sprite is None:
+            sprite = self._sprite = self._get_sprite()
+        return sprite
+
     def draw(self, screen: pygame.Surface):
         """Render the vehicle on screen."""
-        # Draw main body
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=3)
-
-        # Emergency vehicles get a stripe
-        if self.is_emergency:
-            MIN_STRIPE_WIDTH = 3
-            stripe_width = max(MIN_STRIPE_WIDTH, self.width // 4)
-            if self.direction in (Direction.NORTH, Direction.SOUTH):
-                stripe_rect = pygame.Rect(
-                    self.rect.x + (self.width - stripe_width) // 2,
-                    self.rect.y,
-                    stripe_width,
-                    self.height,
-                )
-            else:
-                stripe_rect = pygame.Rect(
-                    self.rect.x,
-                    self.rect.y + (self.height - stripe_width) // 2,
-                    self.width,
-                    stripe_width,
-                )
-            pygame.draw.rect(screen, EMERGENCY_STRIPE_COLOR, stripe_rect)
-
-        # Border for definition
-        border_color = tuple(max(0, c - 40) for c in self.color)
-        pygame.draw.rect(screen, border_color, self.rect, width=1, border_radius=3)
+        screen.blit(self.sprite, self.rect)
 
 
 # ═══════════════════════════════════════════════
@@ -430,6 +510,8 @@ class VehicleSpawner:
     Ensures no vehicle spawns on top of another.
     """
 
+    __slots__ = ("intersection", "spawn_rate", "_next_rand")
+
     def __init__(self, intersection, spawn_rate: float):
         """
         Args:
@@ -439,9 +521,12 @@ class VehicleSpawner:
         self.intersection = intersection
         self.spawn_rate = spawn_rate
 
+        # Next uniform [0, 1) sample, from a per-spawner batched stream
+        self._next_rand = _uniforms(np.random.default_rng()).__next__
+
     def should_spawn(self) -> bool:
         """Random check against spawn rate."""
-        return random.random() < self.spawn_rate
+        return self._next_rand() < self.spawn_rate
 
     def set_rate(self, spawn_rate: float) -> None:
         """Update spawn probability used for future spawn checks."""
@@ -461,7 +546,7 @@ class VehicleSpawner:
         """
         x, y = lane.start_pos
         vehicle = Vehicle(direction, lane, x, y, is_emergency=is_emergency)
-        lane.vehicles.append(vehicle)
+        lane.add_vehicle(vehicle)
         return vehicle
 
     def is_spawn_zone_clear(self, lane, spawn_radius: float = 60.0) -> bool:
@@ -475,14 +560,15 @@ class VehicleSpawner:
         Returns:
             True if zone is clear, False otherwise
         """
+        if not lane.vehicles:
+            return True
+        # Lane is ordered front-first and everything moves away from the
+        # spawn point, so the tail vehicle is always the closest one. It is
+        # also colinear with the spawn point, so only the travel axis matters.
+        v = lane.vehicles[-1]
         sx, sy = lane.start_pos
-        for v in lane.vehicles:
-            dx = v.x - sx
-            dy = v.y - sy
-            dist = (dx * dx + dy * dy) ** 0.5
-            if dist < spawn_radius:
-                return False
-        return True
+        gap = v.y - sy if lane.axis_y else v.x - sx
+        return abs(gap) >= spawn_radius
 
     def try_spawn_all_directions(self, vehicles_list: list) -> None:
         """
@@ -519,14 +605,14 @@ class VehicleSpawner:
                 continue
             
             # Pick a random lane
-            lane = random.choice(incoming_lanes)
+            lane = incoming_lanes[int(self._next_rand() * len(incoming_lanes))]
             
             # Check if spawn zone is clear
             if not self.is_spawn_zone_clear(lane):
                 continue
             
             # Randomly spawn emergency vehicle
-            is_emergency = random.random() < EMERGENCY_SPAWN_RATE
+            is_emergency = self._next_rand() < EMERGENCY_SPAWN_RATE
             
             # Create and add vehicle
             vehicle = self.spawn_vehicle(direction, lane, is_emergency=is_emergency)
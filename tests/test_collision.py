@@ -12,7 +12,11 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import inspect
+
+import numpy as np
 import pygame
+import pytest
 pygame.init()  # needed for Rect
 
 from config.settings import Direction, SAFE_DISTANCE
@@ -20,6 +24,7 @@ from simulation.collision import (
     aabb_overlap,
     inflate_rect,
     safe_distance_overlap,
+    grid_cells,
     CollisionManager,
     MoveProposal,
 )
@@ -38,6 +43,24 @@ def _get_lane(intersection, direction, index=0):
     return intersection.get_incoming_lanes_for(direction)[index]
 
 
+def _reset_lanes(intersection):
+    """Empty every lane so a shared Intersection starts each test clean."""
+    for lane in intersection.get_all_incoming_lanes():
+        lane.vehicles.clear()
+    return intersection
+
+
+@pytest.fixture(scope="module")
+def _shared_intersection():
+    return Intersection()
+
+
+@pytest.fixture
+def intersection(_shared_intersection):
+    """One Intersection per module, with its lanes emptied for each test."""
+    return _reset_lanes(_shared_intersection)
+
+
 # ═══════════════════════════════════════════
 # AABB geometry tests
 # ═══════════════════════════════════════════
@@ -77,13 +100,21 @@ def test_safe_distance_overlap():
     assert safe_distance_overlap(a, b, 5), "Should overlap with margin"
 
 
+def test_grid_cells_cover_every_touched_cell():
+    """A rect straddling cell boundaries must be bucketed into each cell."""
+    a = pygame.Rect(30, 30, 20, 20)     # spans four 40px cells
+    b = pygame.Rect(45, 45, 10, 10)     # lives in cell (1, 1) only
+    assert sorted(grid_cells(a, cell=40)) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert grid_cells(b, cell=40) == [(1, 1)]
+    assert grid_cells(pygame.Rect(-5, 0, 10, 10), cell=40) == [(-1, 0), (0, 0)]
+
+
 # ═══════════════════════════════════════════
 # CollisionManager tests
 # ═══════════════════════════════════════════
 
-def test_no_collision_when_apart():
+def test_no_collision_when_apart(intersection):
     """Two vehicles far apart should both be approved."""
-    intersection = Intersection()
     lane_n = _get_lane(intersection, Direction.NORTH, 0)
     lane_s = _get_lane(intersection, Direction.SOUTH, 0)
 
@@ -103,9 +134,8 @@ def test_no_collision_when_apart():
     assert len(rejected) == 0
 
 
-def test_collision_blocks_lower_priority():
+def test_collision_blocks_lower_priority(intersection):
     """When two vehicles collide, at least one is rejected."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
 
     v1 = _make_vehicle(Direction.NORTH, lane, 300, 400)
@@ -125,9 +155,8 @@ def test_collision_blocks_lower_priority():
     assert mgr.collision_count > 0
 
 
-def test_rejected_proposal_does_not_reject_others_in_pairwise_loop():
+def test_rejected_proposal_does_not_reject_others_in_pairwise_loop(intersection):
     """Once a proposal is rejected, it must not keep rejecting later proposals."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
 
     v_j = _make_vehicle(Direction.NORTH, lane, 300, 400)
@@ -170,9 +199,34 @@ def test_rejected_proposal_does_not_reject_others_in_pairwise_loop():
     assert v_k.id in approved_ids, "Later proposal should not be rejected by an already rejected one"
 
 
-def test_emergency_vehicle_gets_priority():
+def test_collision_count_is_per_conflicting_pair(intersection):
+    """A loser overlapping two accepted proposals adds two to collision_count."""
+    lane = _get_lane(intersection, Direction.NORTH, 0)
+
+    v_a = _make_vehicle(Direction.NORTH, lane, 300, 600, is_emergency=True)
+    v_b = _make_vehicle(Direction.NORTH, lane, 300, 700)
+    v_c = _make_vehicle(Direction.NORTH, lane, 300, 800)
+
+    def _proposal(v, rect):
+        return MoveProposal(vehicle=v, next_x=rect.centerx, next_y=rect.centery,
+                            next_rect=rect, next_speed=2.0,
+                            next_state=VehicleState.MOVING)
+
+    # A and B are apart; C's proposal straddles both
+    p_a = _proposal(v_a, pygame.Rect(100, 100, 10, 10))
+    p_b = _proposal(v_b, pygame.Rect(130, 100, 10, 10))
+    p_c = _proposal(v_c, pygame.Rect(108, 100, 25, 10))
+
+    mgr = CollisionManager()
+    approved, rejected = mgr.validate_all([p_c, p_b, p_a], intersection.conflict_zone)
+
+    assert {p.vehicle.id for p in approved} == {v_a.id, v_b.id}
+    assert [p.vehicle.id for p in rejected] == [v_c.id]
+    assert mgr.collision_count == 2
+
+
+def test_emergency_vehicle_gets_priority(intersection):
     """Emergency vehicle should win conflict resolution."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
 
     # Place vehicles far enough that the winner's proposed rect doesn't
@@ -198,10 +252,9 @@ def test_emergency_vehicle_gets_priority():
     assert v_normal.id in rejected_ids, "Normal vehicle should be rejected"
 
 
-def test_intersection_cap():
+def test_intersection_cap(intersection):
     """Intersection should not have more than INTERSECTION_MAX_OCCUPANTS."""
     from config.settings import INTERSECTION_MAX_OCCUPANTS
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
 
     iz = intersection.conflict_zone
@@ -227,13 +280,65 @@ def test_intersection_cap():
     approved, rejected = mgr.validate_all(proposals, intersection.conflict_zone)
 
     # Some should be in the intersection (up to cap), others rejected
-    in_zone_approved = [p for p in approved if aabb_overlap(p.next_rect, iz)]
-    assert len(in_zone_approved) <= INTERSECTION_MAX_OCCUPANTS
+    arr = np.array(
+        [(r.left, r.top, r.right, r.bottom) for r in (p.next_rect for p in approved)],
+        dtype=np.int32,
+    ).reshape(-1, 4)
+    in_zone = (
+        (arr[:, 0] < iz.right)
+        & (arr[:, 2] > iz.left)
+        & (arr[:, 1] < iz.bottom)
+        & (arr[:, 3] > iz.top)
+    )
+    assert np.count_nonzero(in_zone) <= INTERSECTION_MAX_OCCUPANTS
 
 
-def test_propose_commit_pipeline():
+def test_validate_all_raw_pairwise_priority(intersection):
+    """Array path: of two overlapping rects the higher priority is approved."""
+    iz = intersection.conflict_zone
+    # All well away from the conflict zone, so only the pairwise phase applies
+    rects = np.array([
+        [10, 10, 40, 40],     # low priority, overlaps rect 1
+        [20, 20, 50, 50],     # high priority
+        [300, 10, 330, 40],   # far from everything
+        [10, 100, 40, 130],   # equal priority pair: lower index wins
+        [15, 105, 45, 135],
+    ], dtype=np.int32)
+    priorities = np.array([1, 2, 1, 1, 1], dtype=np.int32)
+
+    mgr = CollisionManager()
+    approved = mgr.validate_all_raw(rects, priorities, iz)
+
+    assert approved.tolist() == [False, True, True, True, False]
+    assert mgr.collision_count == 2
+
+
+def test_validate_all_raw_intersection_cap(intersection):
+    """Array path: the cap keeps the highest-priority, lowest-index rects."""
+    from config.settings import INTERSECTION_MAX_OCCUPANTS
+    iz = intersection.conflict_zone
+    n = INTERSECTION_MAX_OCCUPANTS + 4
+
+    # n well-spaced 10x10 rects inside the conflict zone (no pairwise conflicts)
+    idx = np.arange(n)
+    x1 = iz.left + 2 + (idx % 6) * 14
+    y1 = iz.top + 2 + (idx // 6) * 14
+    rects = np.stack([x1, y1, x1 + 10, y1 + 10], axis=1).astype(np.int32)
+    priorities = np.ones(n, dtype=np.int32)
+    priorities[-1] = 3  # emergency-level priority always gets in
+
+    mgr = CollisionManager()
+    approved = mgr.validate_all_raw(rects, priorities, iz)
+
+    assert approved.sum() == INTERSECTION_MAX_OCCUPANTS
+    assert approved[-1]
+    assert approved[:INTERSECTION_MAX_OCCUPANTS - 1].all()
+    assert not approved[INTERSECTION_MAX_OCCUPANTS - 1:-1].any()
+    assert mgr.collision_count == 4
+
+
+def test_propose_commit_pipeline(intersection):
     """Propose → commit should update vehicle position correctly."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
     v = _make_vehicle(Direction.NORTH, lane, 300, 700)
 
@@ -245,9 +350,8 @@ def test_propose_commit_pipeline():
     assert v.speed > 0, "Vehicle should have non-zero speed"
 
 
-def test_propose_reject_pipeline():
+def test_propose_reject_pipeline(intersection):
     """Reject should keep vehicle at original position."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
     v = _make_vehicle(Direction.NORTH, lane, 300, 700)
 
@@ -260,10 +364,9 @@ def test_propose_reject_pipeline():
     assert v.state == VehicleState.WAITING
 
 
-def test_vehicle_resumes_after_rejection():
+def test_vehicle_resumes_after_rejection(intersection):
     """Vehicle should resume moving after its proposal is rejected and the
     blocking vehicle moves away (i.e. speed must recover from zero)."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
     v = _make_vehicle(Direction.NORTH, lane, 300, 700)
 
@@ -283,10 +386,9 @@ def test_vehicle_resumes_after_rejection():
     assert v.state != VehicleState.WAITING, "Vehicle should no longer be WAITING"
 
 
-def test_vehicle_resumes_after_front_vehicle_leaves():
+def test_vehicle_resumes_after_front_vehicle_leaves(intersection):
     """Vehicle stopped behind another should resume when the front car moves
     far enough away."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
 
     # Front vehicle far ahead; back vehicle was previously rejected (speed=0)
@@ -325,9 +427,40 @@ def test_vehicle_resumes_after_front_vehicle_leaves():
     )
 
 
-def test_assert_no_overlaps_clean():
+def test_lane_front_gap_matches_scan_for_any_lane_order(intersection):
+    """Vehicles put in a lane by hand (in any order) still see the car ahead."""
+    lane = _get_lane(intersection, Direction.NORTH, 0)
+    v_back = _make_vehicle(Direction.NORTH, lane, 300, 700)
+    v_front = _make_vehicle(Direction.NORTH, lane, 300, 660)
+    lane.vehicles.extend([v_back, v_front])   # back first: not front-first
+
+    assert v_back.check_front_vehicle(lane.vehicles) == 10.0
+    assert v_back._lane_front_gap() == 10.0
+    assert v_front._lane_front_gap() is None
+
+
+def test_lane_links_follow_removals(intersection):
+    """add_vehicle links each vehicle to the one ahead; removals relink."""
+    lane = _get_lane(intersection, Direction.NORTH, 0)
+    v1 = _make_vehicle(Direction.NORTH, lane, 300, 500)
+    v2 = _make_vehicle(Direction.NORTH, lane, 300, 600)
+    v3 = _make_vehicle(Direction.NORTH, lane, 300, 700)
+    for v in (v1, v2, v3):
+        lane.add_vehicle(v)
+    assert (v1.leader, v2.leader, v3.leader) == (None, v1, v2)
+    assert v3._lane_front_gap() == v3.check_front_vehicle(lane.vehicles)
+
+    lane.remove_vehicle(v2)            # from the middle
+    assert v3.leader is v1
+    assert v3._lane_front_gap() == v3.check_front_vehicle(lane.vehicles)
+
+    lane.remove_vehicle(v1)            # lead vehicle leaves
+    assert v3.leader is None
+    assert v3._lane_front_gap() is None
+
+
+def test_assert_no_overlaps_clean(intersection):
     """assert_no_overlaps should pass for well-separated vehicles."""
-    intersection = Intersection()
     lane_n = _get_lane(intersection, Direction.NORTH, 0)
     lane_s = _get_lane(intersection, Direction.SOUTH, 0)
 
@@ -338,9 +471,8 @@ def test_assert_no_overlaps_clean():
     CollisionManager.assert_no_overlaps([v1, v2])
 
 
-def test_count_overlaps():
+def test_count_overlaps(intersection):
     """count_current_overlaps should correctly count overlapping pairs."""
-    intersection = Intersection()
     lane = _get_lane(intersection, Direction.NORTH, 0)
 
     v1 = _make_vehicle(Direction.NORTH, lane, 300, 400)
@@ -350,9 +482,8 @@ def test_count_overlaps():
     assert count == 1, f"Expected 1 overlap, got {count}"
 
 
-def test_perpendicular_collision():
+def test_perpendicular_collision(intersection):
     """N/S and E/W vehicles at intersection should trigger collision detection."""
-    intersection = Intersection()
     lane_n = _get_lane(intersection, Direction.NORTH, 0)
     lane_e = _get_lane(intersection, Direction.EAST, 0)
 
@@ -392,8 +523,7 @@ def test_environment_step_no_crash():
     env.close()
 
 
-def test_vehicle_spawner_set_rate_updates_spawn_rate():
-    intersection = Intersection()
+def test_vehicle_spawner_set_rate_updates_spawn_rate(intersection):
     spawner = VehicleSpawner(intersection, spawn_rate=0.05)
     spawner.set_rate(0.08)
     assert spawner.spawn_rate == 0.08
@@ -431,14 +561,20 @@ if __name__ == "__main__":
         test_aabb_adjacent_no_overlap,
         test_inflate_rect,
         test_safe_distance_overlap,
+        test_grid_cells_cover_every_touched_cell,
         test_no_collision_when_apart,
         test_collision_blocks_lower_priority,
+        test_collision_count_is_per_conflicting_pair,
         test_emergency_vehicle_gets_priority,
         test_intersection_cap,
+        test_validate_all_raw_pairwise_priority,
+        test_validate_all_raw_intersection_cap,
         test_propose_commit_pipeline,
         test_propose_reject_pipeline,
         test_vehicle_resumes_after_rejection,
         test_vehicle_resumes_after_front_vehicle_leaves,
+        test_lane_front_gap_matches_scan_for_any_lane_order,
+        test_lane_links_follow_removals,
         test_assert_no_overlaps_clean,
         test_count_overlaps,
         test_perpendicular_collision,
@@ -446,11 +582,15 @@ if __name__ == "__main__":
         test_environment_100_steps_zero_overlaps,
     ]
 
+    shared = Intersection()
     passed = 0
     failed = 0
     for test_fn in tests:
         try:
-            test_fn()
+            if "intersection" in inspect.signature(test_fn).parameters:
+                test_fn(_reset_lanes(shared))
+            else:
+                test_fn()
             print(f"  ✅ {test_fn.__name__}")
             passed += 1
         except Exception as e:
@@ -30,7 +30,9 @@ def plot_training_curve(rewards: list, path: str = "models/training_curve.png"):
     window = 20
     if len(rewards) >= window:
         import numpy as np
-        smoothed = np.convolve(rewards, np.ones(window) / window, mode="valid")
+        # Prefix-sum moving average: O(n) regardless of window size
+        cs = np.cumsum(np.insert(np.asarray(rewards, dtype=float), 0, 0.0))
+        smoothed = (cs[window:] - cs[:-window]) / window
         plt.plot(range(window - 1, len(rewards)), smoothed, color="orange",
                  linewidth=2, label=f"Moving avg ({window})")
 
@@ -3,9 +3,16 @@ Traffic-Mind – Dashboard (metrics tracker for the HUD)
 """
 
 import time
+from collections import deque
 from config.settings import Direction, CO2_IDLE_RATE, CO2_MOVING_RATE
 from simulation.vehicle import VehicleState
 
+# Iterated every frame; avoid re-walking the enum each time
+_DIRECTIONS = tuple(Direction)
+
+# Per-interval history kept for the HUD (one hour at one sample per second)
+_HISTORY_LEN = 3600
+
 
 class Dashboard:
     """Tracks live and historical performance metrics for the UI overlay."""
@@ -16,18 +23,19 @@ class Dashboard:
     def reset(self):
         self.total_cars_passed = 0
         self.total_cars_spawned = 0
-        self.throughput_history = []      # per-interval throughput
-        self.wait_time_history = []
+        self.throughput_history = deque(maxlen=_HISTORY_LEN)  # per-interval throughput
+        self.wait_time_history = deque(maxlen=_HISTORY_LEN)
         self._interval_passed = 0
         self._frame_counter = 0
         self._interval_frames = 60       # compute stats every second
 
         self.current_avg_wait = 0.0
         self.current_max_wait = 0.0
-        self.queue_lengths = {d: 0 for d in Direction}
+        self.queue_lengths = dict.fromkeys(_DIRECTIONS, 0)
         self.co2_total = 0.0
 
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self.elapsed = 0.0               # refreshed once per update()
         self.fps = 0.0
 
         # Per-controller totals for final comparison
@@ -36,17 +44,18 @@ class Dashboard:
             "Smart (Rule-Based)": {"passed": 0, "wait_sum": 0, "wait_count": 0},
             "AI (DQN)": {"passed": 0, "wait_sum": 0, "wait_count": 0},
         }
-        self._active_ctrl_name = "Timer (Dumb)"
+        self.set_controller_name("Timer (Dumb)")
 
     def set_controller_name(self, name: str):
         self._active_ctrl_name = name
+        self._active_totals = self.controller_totals.get(name)
 
     def record_passed(self, vehicle):
         """Called when a vehicle crosses the intersection."""
         self.total_cars_passed += 1
         self._interval_passed += 1
 
-        ct = self.controller_totals.get(self._active_ctrl_name)
+        ct = self._active_totals
         if ct is not None:
             ct["passed"] += 1
             ct["wait_sum"] += vehicle.wait_time
@@ -56,17 +65,25 @@ class Dashboard:
         """Called every frame."""
         self._frame_counter += 1
         self.fps = fps
-
-        # Queue lengths
-        for d in Direction:
-            self.queue_lengths[d] = sum(
-                1 for v in vehicles if v.direction == d and v.state == VehicleState.WAITING
-            )
-
-        # Wait times
-        waits = [v.wait_time for v in vehicles if v.state == VehicleState.WAITING]
-        self.current_avg_wait = (sum(waits) / len(waits)) if waits else 0.0
-        self.current_max_wait = max(waits) if waits else 0.0
+        self.elapsed = time.monotonic() - self.start_time
+
+        # Queue lengths and wait times in a single pass over the vehicles
+        queues = dict.fromkeys(_DIRECTIONS, 0)
+        waiting = VehicleState.WAITING
+        idle_count = 0
+        wait_sum = 0
+        wait_max = 0.0
+        for v in vehicles:
+            if v.state == waiting:
+                queues[v.direction] += 1
+                idle_count += 1
+                w = v.wait_time
+                wait_sum += w
+                if w > wait_max:
+                    wait_max = w
+        self.queue_lengths = queues
+        self.current_avg_wait = (wait_sum / idle_count) if idle_count else 0.0
+        self.current_max_wait = wait_max
 
         # Interval stats (once per second)
         if self._frame_counter >= self._interval_frames:
@@ -76,14 +93,13 @@ class Dashboard:
             self._frame_counter = 0
 
         # CO2 emissions
-        idle_count = sum(1 for v in vehicles if v.state == VehicleState.WAITING)
-        moving_count = sum(1 for v in vehicles if v.state != VehicleState.WAITING)
+        moving_count = len(vehicles) - idle_count
         self.co2_total += idle_count * CO2_IDLE_RATE + moving_count * CO2_MOVING_RATE
 
     def get_metrics(self) -> dict:
         return {
             "fps": self.fps,
-            "elapsed": time.time() - self.start_time,
+            "elapsed": self.elapsed,
             "throughput": self.throughput_history[-1] if self.throughput_history else 0,
             "avg_wait": self.current_avg_wait,
             "max_wait": self.current_max_wait,
@@ -92,7 +108,7 @@ class Dashboard:
             "total_waiting": sum(self.queue_lengths.values()),
             "total_vehicles": sum(self.queue_lengths.values()) + 0,  # filled by caller
             "co2_total": self.co2_total,
-            "throughput_history": list(self.throughput_history),
+            "throughput_history": self.throughput_history,  # live deque, read-only
         }
 
     def get_comparison_data(self) -> dict:
@@ -4,6 +4,9 @@ Traffic-Mind – PyGame Renderer (beautiful dark-theme visualisation)
 
 import pygame
 import math
+from itertools import islice
+
+import numpy as np
 from config.settings import (
     Direction,
     SCREEN_WIDTH, SCREEN_HEIGHT,
@@ -20,6 +23,45 @@ from config.settings import (
     UI_ACCENT_BLUE, UI_ACCENT_GREEN, UI_ACCENT_RED, UI_ACCENT_YELLOW,
 )
 
+# Upper bound on cached text surfaces before the cache is reset
+_TEXT_CACHE_SIZE = 512
+
+# HUD layout
+_HUD_BG = (20, 20, 20)
+_HUD_ALPHA = 200
+_TOP_BAR_H = 60
+_PANEL_W, _PANEL_H = 220, 310
+_PANEL_X, _PANEL_Y = 10, 75
+_BOT_BAR_H = 40
+_GRAPH_W, _GRAPH_H = 180, 80
+
+# The HUD readouts are re-laid-out every this many frames (~10 Hz at 60 FPS)
+_UI_REFRESH_FRAMES = 6
+
+# Beyond this many dirty rects a single full flip() is cheaper
+_MAX_DIRTY_RECTS = 50
+
+# Bottom-bar key hints; the first three select the mode with that index
+_CONTROLS = ("[1] Timer", "[2] Smart", "[3] AI", "[R] Reset", "[+/-] Density", "[H] Hardware")
+_MODE_ACTIVE_IDX = {"Timer (Dumb)": 0, "Smart (Rule-Based)": 1, "AI (DQN)": 2}
+
+# Fixed road geometry (depends only on the intersection settings)
+_INTERSECTION_RECT = (INTERSECTION_LEFT, INTERSECTION_TOP, INTERSECTION_SIZE, INTERSECTION_SIZE)
+_STOP_LINES = (
+    # North (bottom of intersection, right half)
+    ((INTERSECTION_CENTER_X, INTERSECTION_BOTTOM), (INTERSECTION_CENTER_X + ROAD_WIDTH, INTERSECTION_BOTTOM)),
+    # South (top of intersection, left half)
+    ((INTERSECTION_CENTER_X - ROAD_WIDTH, INTERSECTION_TOP), (INTERSECTION_CENTER_X, INTERSECTION_TOP)),
+    # East (left of intersection, bottom half)
+    ((INTERSECTION_LEFT, INTERSECTION_CENTER_Y), (INTERSECTION_LEFT, INTERSECTION_CENTER_Y + ROAD_WIDTH)),
+    # West (right of intersection, top half)
+    ((INTERSECTION_RIGHT, INTERSECTION_CENTER_Y - ROAD_WIDTH), (INTERSECTION_RIGHT, INTERSECTION_CENTER_Y)),
+)
+
+# Queue rows in the stats panel, top to bottom
+_DIR_ITEMS = (("N", Direction.NORTH), ("S", Direction.SOUTH),
+              ("E", Direction.EAST), ("W", Direction.WEST))
+
 
 class Renderer:
     """High-quality PyGame rendering engine."""
@@ -38,9 +80,80 @@ class Renderer:
 
         self.frame_count = 0
 
+        # Rendered text keyed by (font, string, colour); see _text()
+        self._text_cache = {}
+
+        # Translucent HUD backgrounds: opaque surfaces with a surface-wide
+        # alpha, which blit faster than per-pixel SRCALPHA ones
+        self._top_bar = self._hud_surface((width, _TOP_BAR_H), _HUD_ALPHA)
+        self._panel = self._hud_surface((_PANEL_W, _PANEL_H), _HUD_ALPHA)
+        self._bot_bar = self._hud_surface((width, _BOT_BAR_H), _HUD_ALPHA)
+        self._graph_bg = self._hud_surface((_GRAPH_W, _GRAPH_H), 160)
+        # HUD bars/text from the last _layout_ui() and the frames since
+        self._ui_layout = None
+        self._ui_mode = None
+        self._ui_age = 0
+
+        # Last drawn throughput graph and the (samples, mode) it shows
+        self._graph_surf = None
+        self._graph_key = None
+
+        # Persistent rects for the HUD outlines
+        self._panel_rect = pygame.Rect(_PANEL_X, _PANEL_Y, _PANEL_W, _PANEL_H)
+        self._graph_rect = pygame.Rect(width - _GRAPH_W - 15, height - 55 - _GRAPH_H, _GRAPH_W, _GRAPH_H)
+        # (fill, outline) per queue row; _layout_ui only resizes the fill
+        queue_y = _PANEL_Y + 10 + 30 + 4 * 22 + 5
+        self._queue_bars = [
+            (pygame.Rect(_PANEL_X + 95, queue_y + i * 22 + 2, 0, 14),
+             pygame.Rect(_PANEL_X + 95, queue_y + i * 22 + 2, 100, 14))
+            for i in range(len(_DIR_ITEMS))
+        ]
+
+        # Display regions refreshed every frame besides the vehicles/lights
+        self._hud_rects = [
+            pygame.Rect(0, 0, width, _TOP_BAR_H),
+            self._panel_rect,
+            pygame.Rect(0, height - _BOT_BAR_H, width, _BOT_BAR_H),
+            self._graph_rect,
+        ]
+        self._prev_vehicle_rects = []
+        self._full_flip = True
+
+        # Grass, roads and markings never change: paint them once, blit per frame
+        self._static_bg = pygame.Surface((width, height)).convert()
+        self._build_static_bg()
+
+    def _build_static_bg(self):
+        """Paint the background and road layers into ``self._static_bg``."""
+        self.draw_background(self._static_bg)
+        self.draw_roads(self._static_bg)
+
+    def invalidate(self):
+        """Push the whole window on the next frame (after drawing outside render_frame)."""
+        self._full_flip = True
+
+    @staticmethod
+    def _hud_surface(size, alpha: int) -> pygame.Surface:
+        """Opaque HUD background of *size*, blended at a constant *alpha*."""
+        surf = pygame.Surface(size).convert()
+        surf.fill(_HUD_BG)
+        surf.set_alpha(alpha)
+        return surf
+
+    def _text(self, font: pygame.font.Font, string: str, color) -> pygame.Surface:
+        """Return *string* rendered in *font*/*color*, rasterising it only once."""
+        key = (font, string, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.clear()  # counters churn; start over rather than grow
+            surf = self._text_cache[key] = font.render(string, True, color).convert_alpha()
+        return surf
+
     # ─── background & grass ───────────────
-    def draw_background(self):
-        self.screen.fill(BACKGROUND_COLOR)
+    def draw_background(self, surface: pygame.Surface = None):
+        surface = self.screen if surface is None else surface
+        surface.fill(BACKGROUND_COLOR)
 
         # Four grass quadrants (corners between roads)
         patches = [
@@ -51,23 +164,22 @@ class Renderer:
              self.width - INTERSECTION_RIGHT, self.height - INTERSECTION_BOTTOM),
         ]
         for x, y, w, h in patches:
-            pygame.draw.rect(self.screen, GRASS_COLOR, (x, y, w, h))
+            pygame.draw.rect(surface, GRASS_COLOR, (x, y, w, h))
 
     # ─── roads ────────────────────────────
-    def draw_roads(self):
+    def draw_roads(self, surface: pygame.Surface = None):
+        surface = self.screen if surface is None else surface
         cx, cy = INTERSECTION_CENTER_X, INTERSECTION_CENTER_Y
 
         # Horizontal road
-        pygame.draw.rect(self.screen, ROAD_COLOR,
+        pygame.draw.rect(surface, ROAD_COLOR,
                          (0, cy - ROAD_WIDTH, self.width, ROAD_WIDTH * 2))
         # Vertical road
-        pygame.draw.rect(self.screen, ROAD_COLOR,
+        pygame.draw.rect(surface, ROAD_COLOR,
                          (cx - ROAD_WIDTH, 0, ROAD_WIDTH * 2, self.height))
 
         # Intersection centre
-        pygame.draw.rect(self.screen, INTERSECTION_COLOR,
-                         (INTERSECTION_LEFT, INTERSECTION_TOP,
-                          INTERSECTION_SIZE, INTERSECTION_SIZE))
+        pygame.draw.rect(surface, INTERSECTION_COLOR, _INTERSECTION_RECT)
 
         # ── lane markings (dashed centre lines) ──
         dash_len = 20
@@ -77,7 +189,7 @@ class Renderer:
         y = 0
         while y < self.height:
             if not (INTERSECTION_TOP - 2 <= y <= INTERSECTION_BOTTOM + 2):
-                pygame.draw.line(self.screen, ROAD_MARKING_COLOR,
+                pygame.draw.line(surface, ROAD_MARKING_COLOR,
                                  (cx, y), (cx, min(y + dash_len, self.height)), 2)
             y += dash_len + gap
 
@@ -85,42 +197,31 @@ class Renderer:
         x = 0
         while x < self.width:
             if not (INTERSECTION_LEFT - 2 <= x <= INTERSECTION_RIGHT + 2):
-                pygame.draw.line(self.screen, ROAD_MARKING_COLOR,
+                pygame.draw.line(surface, ROAD_MARKING_COLOR,
                                  (x, cy), (min(x + dash_len, self.width), cy), 2)
             x += dash_len + gap
 
         # ── edge lines (solid) ──
         for offset in (-ROAD_WIDTH, ROAD_WIDTH):
             # Vertical edges
-            pygame.draw.line(self.screen, (100, 100, 100),
+            pygame.draw.line(surface, (100, 100, 100),
                              (cx + offset, 0), (cx + offset, INTERSECTION_TOP), 1)
-            pygame.draw.line(self.screen, (100, 100, 100),
+            pygame.draw.line(surface, (100, 100, 100),
                              (cx + offset, INTERSECTION_BOTTOM), (cx + offset, self.height), 1)
             # Horizontal edges
-            pygame.draw.line(self.screen, (100, 100, 100),
+            pygame.draw.line(surface, (100, 100, 100),
                              (0, cy + offset), (INTERSECTION_LEFT, cy + offset), 1)
-            pygame.draw.line(self.screen, (100, 100, 100),
+            pygame.draw.line(surface, (100, 100, 100),
                              (INTERSECTION_RIGHT, cy + offset), (self.width, cy + offset), 1)
 
         # ── stop lines ──
-        lw = 3
-        # North stop line (bottom of intersection, right half)
-        pygame.draw.line(self.screen, STOP_LINE_COLOR,
-                         (cx, INTERSECTION_BOTTOM), (cx + ROAD_WIDTH, INTERSECTION_BOTTOM), lw)
-        # South stop line (top of intersection, left half)
-        pygame.draw.line(self.screen, STOP_LINE_COLOR,
-                         (cx - ROAD_WIDTH, INTERSECTION_TOP), (cx, INTERSECTION_TOP), lw)
-        # East stop line (left of intersection, bottom half)
-        pygame.draw.line(self.screen, STOP_LINE_COLOR,
-                         (INTERSECTION_LEFT, cy), (INTERSECTION_LEFT, cy + ROAD_WIDTH), lw)
-        # West stop line (right of intersection, top half)
-        pygame.draw.line(self.screen, STOP_LINE_COLOR,
-                         (INTERSECTION_RIGHT, cy - ROAD_WIDTH), (INTERSECTION_RIGHT, cy), lw)
+        for start, end in _STOP_LINES:
+            pygame.draw.line(surface, STOP_LINE_COLOR, start, end, 3)
 
     # ─── vehicles ─────────────────────────
     def draw_vehicles(self, vehicles):
-        for v in vehicles:
-            v.draw(self.screen)
+        # One blits() call for every vehicle sprite instead of N draw() calls
+        self.screen.blits([(v.sprite, v.rect) for v in vehicles], doreturn=False)
 
     # ─── traffic lights ───────────────────
     def draw_traffic_lights(self, controller):
@@ -128,37 +229,60 @@ class Renderer:
 
     # ─── UI overlay ───────────────────────
     def draw_ui_overlay(self, metrics: dict, mode: str):
-        # ── Top bar ──
-        top_bar = pygame.Surface((self.width, 60), pygame.SRCALPHA)
-        top_bar.fill((20, 20, 20, 200))
-        self.screen.blit(top_bar, (0, 0))
-
-        title = self.font_large.render("🚦 Traffic-Mind", True, UI_ACCENT_BLUE)
-        self.screen.blit(title, (15, 5))
-
-        mode_surf = self.font_med.render(f"Mode: {mode}", True, UI_ACCENT_GREEN)
-        self.screen.blit(mode_surf, (250, 8))
+        # Backgrounds every frame (vehicles pass underneath); the bars and
+        # text on top come from a layout rebuilt every _UI_REFRESH_FRAMES
+        # frames, or at once when the mode changes.
+        screen = self.screen
+        screen.blits(
+            [(self._top_bar, (0, 0)), (self._panel, self._panel_rect),
+             (self._bot_bar, (0, self.height - _BOT_BAR_H))],
+            doreturn=False,
+        )
+        pygame.draw.rect(screen, UI_PANEL_BORDER, self._panel_rect, 1, border_radius=4)
+
+        self._ui_age += 1
+        if self._ui_layout is None or self._ui_age >= _UI_REFRESH_FRAMES or mode != self._ui_mode:
+            self._ui_layout = self._layout_ui(metrics, mode)
+            self._ui_mode = mode
+            self._ui_age = 0
+
+        rects, texts = self._ui_layout
+        for color, rect, width, radius in rects:
+            pygame.draw.rect(screen, color, rect, width, border_radius=radius)
+        screen.blits(texts, doreturn=False)
+
+    def _layout_ui(self, metrics: dict, mode: str):
+        """Return the HUD's rect primitives and (text surface, pos) pairs."""
+        px, py = _PANEL_X, _PANEL_Y
+        by = self.height - _BOT_BAR_H
+        text = self._text
+        rects = []
+        texts = []
+        add = texts.append
 
-        fps_surf = self.font_small.render(
-            f"FPS: {metrics.get('fps', 0):.0f}  |  "
-            f"Time: {metrics.get('elapsed', 0):.0f}s  |  "
+        # ── Top bar ──
+        title = text(self.font_large, "🚦 Traffic-Mind", UI_ACCENT_BLUE)
+        add((title, (15, 5)))
+
+        mode_surf = text(self.font_med, f"Mode: {mode}", UI_ACCENT_GREEN)
+        add((mode_surf, (250, 8)))
+
+        # FPS to the nearest 5 and whole seconds, so the string (and its
+        # cached surface) only changes a few times a second
+        fps_q = round(metrics.get('fps', 0) / 5) * 5
+        fps_surf = text(
+            self.font_small,
+            f"FPS: {fps_q}  |  "
+            f"Time: {int(metrics.get('elapsed', 0))}s  |  "
             f"Cars: {metrics.get('total_vehicles', 0)}",
-            True, UI_TEXT_SECONDARY,
+            UI_TEXT_SECONDARY,
         )
-        self.screen.blit(fps_surf, (250, 32))
+        add((fps_surf, (250, 32)))
 
         # ── Left panel ──
-        panel_w = 220
-        panel_h = 310
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        panel_surf.fill((20, 20, 20, 200))
-        px, py = 10, 75
-        self.screen.blit(panel_surf, (px, py))
-        pygame.draw.rect(self.screen, UI_PANEL_BORDER, (px, py, panel_w, panel_h), 1, border_radius=4)
-
         y = py + 10
-        header = self.font_med.render("📊 Live Stats", True, UI_ACCENT_BLUE)
-        self.screen.blit(header, (px + 15, y)); y += 30
+        header = text(self.font_med, "📊 Live Stats", UI_ACCENT_BLUE)
+        add((header, (px + 15, y))); y += 30
 
         stats = [
             ("Throughput", f"{metrics.get('throughput', 0)}/int"),
@@ -167,98 +291,111 @@ class Renderer:
             ("CO\u2082 Emitted", f"{metrics.get('co2_total', 0):.2f} kg"),
         ]
         for label, val in stats:
-            s = self.font_small.render(f"{label}: {val}", True, UI_TEXT_PRIMARY)
-            self.screen.blit(s, (px + 15, y)); y += 22
+            s = text(self.font_small, f"{label}: {val}", UI_TEXT_PRIMARY)
+            add((s, (px + 15, y))); y += 22
 
         y += 5
         # Queue bars per direction
-        for d_name, d_enum in [("N", Direction.NORTH), ("S", Direction.SOUTH),
-                                ("E", Direction.EAST), ("W", Direction.WEST)]:
-            q = metrics.get("queues", {}).get(d_enum, 0)
-            label = self.font_small.render(f"Queue {d_name}:", True, UI_TEXT_SECONDARY)
-            self.screen.blit(label, (px + 15, y))
+        queues = metrics.get("queues") or {}
+        for (d_name, d_enum), (fill, outline) in zip(_DIR_ITEMS, self._queue_bars):
+            q = queues.get(d_enum, 0)
+            label = text(self.font_small, f"Queue {d_name}:", UI_TEXT_SECONDARY)
+            add((label, (px + 15, y)))
 
             bar_x = px + 95
-            bar_w = max(0, min(q * 10, 100))
             bar_color = UI_ACCENT_GREEN if q < 5 else (UI_ACCENT_YELLOW if q <= 10 else UI_ACCENT_RED)
-            pygame.draw.rect(self.screen, bar_color, (bar_x, y + 2, bar_w, 14), border_radius=2)
-            pygame.draw.rect(self.screen, (60, 60, 60), (bar_x, y + 2, 100, 14), 1, border_radius=2)
+            fill.w = max(0, min(q * 10, 100))
+            rects.append((bar_color, fill, 0, 2))
+            rects.append(((60, 60, 60), outline, 1, 2))
 
-            num = self.font_tiny.render(str(q), True, UI_TEXT_PRIMARY)
-            self.screen.blit(num, (bar_x + 105, y + 1))
+            num = text(self.font_tiny, str(q), UI_TEXT_PRIMARY)
+            add((num, (bar_x + 105, y + 1)))
             y += 22
 
         y += 8
-        passed_s = self.font_small.render(f"Total Passed: {metrics.get('total_passed', 0)}", True, UI_ACCENT_GREEN)
-        self.screen.blit(passed_s, (px + 15, y)); y += 20
-        waiting_s = self.font_small.render(f"Total Waiting: {metrics.get('total_waiting', 0)}", True, UI_ACCENT_RED)
-        self.screen.blit(waiting_s, (px + 15, y))
+        passed_s = text(self.font_small, f"Total Passed: {metrics.get('total_passed', 0)}", UI_ACCENT_GREEN)
+        add((passed_s, (px + 15, y))); y += 20
+        waiting_s = text(self.font_small, f"Total Waiting: {metrics.get('total_waiting', 0)}", UI_ACCENT_RED)
+        add((waiting_s, (px + 15, y)))
 
         # ── Bottom bar ──
-        bot_h = 40
-        bot_surf = pygame.Surface((self.width, bot_h), pygame.SRCALPHA)
-        bot_surf.fill((20, 20, 20, 200))
-        by = self.height - bot_h
-        self.screen.blit(bot_surf, (0, by))
-
-        controls = [
-            ("[1] Timer", mode == "Timer (Dumb)"),
-            ("[2] Smart", mode == "Smart (Rule-Based)"),
-            ("[3] AI", mode == "AI (DQN)"),
-            ("[R] Reset", False),
-            ("[+/-] Density", False),
-            ("[H] Hardware", False),
-        ]
+        active_idx = _MODE_ACTIVE_IDX.get(mode, -1)
         cx = 30
-        for text, active in controls:
+        for i, caption in enumerate(_CONTROLS):
+            active = i == active_idx
             color = UI_ACCENT_GREEN if active else UI_TEXT_SECONDARY
-            s = self.font_small.render(text, True, color)
+            s = text(self.font_small, caption, color)
             if active:
                 rect = s.get_rect(topleft=(cx - 4, by + 10))
                 rect.inflate_ip(8, 4)
-                pygame.draw.rect(self.screen, (*UI_ACCENT_GREEN[:3], 40), rect, border_radius=3)
-            self.screen.blit(s, (cx, by + 12))
+                rects.append(((*UI_ACCENT_GREEN[:3], 40), rect, 0, 3))
+            add((s, (cx, by + 12)))
             cx += s.get_width() + 25
 
+        return rects, texts
+
     # ─── throughput sparkline ─────────────
-    def draw_throughput_graph(self, history: list, mode: str):
+    def draw_throughput_graph(self, history, mode: str):
         if len(history) < 2:
             return
-        gw, gh = 180, 80
+        gw, gh = _GRAPH_W, _GRAPH_H
         gx = self.width - gw - 15
         gy = self.height - 55 - gh
 
-        surf = pygame.Surface((gw, gh), pygame.SRCALPHA)
-        surf.fill((20, 20, 20, 160))
-        self.screen.blit(surf, (gx, gy))
-        pygame.draw.rect(self.screen, UI_PANEL_BORDER, (gx, gy, gw, gh), 1, border_radius=3)
-
-        data = history[-gw:]
-        if not data:
+        # Last gw samples (history may be a deque, which has no slicing)
+        data = tuple(islice(history, max(0, len(history) - gw), None))
+        key = (data, mode)
+        if key == self._graph_key:
+            self.screen.blit(self._graph_surf, (gx, gy))
             return
+
+        self.screen.blit(self._graph_bg, (gx, gy))
+        pygame.draw.rect(self.screen, UI_PANEL_BORDER, self._graph_rect, 1, border_radius=3)
         max_val = max(max(data), 1)
         color_map = {"Timer (Dumb)": UI_ACCENT_RED, "Smart (Rule-Based)": UI_ACCENT_YELLOW, "AI (DQN)": UI_ACCENT_GREEN}
         line_color = color_map.get(mode, UI_ACCENT_BLUE)
 
-        points = []
-        for i, val in enumerate(data):
-            px = gx + int(i * gw / len(data))
-            py_val = gy + gh - 5 - int((val / max_val) * (gh - 10))
-            points.append((px, py_val))
+        # Sample i → (gx + i*gw/n, baseline - scaled value), all samples at once
+        vals = np.asarray(data, dtype=np.float64)
+        n = len(vals)
+        xs = gx + np.arange(n) * gw // n
+        ys = gy + gh - 5 - (vals / max_val * (gh - 10)).astype(np.int64)
+        points = list(zip(xs.tolist(), ys.tolist()))
 
         if len(points) >= 2:
             pygame.draw.lines(self.screen, line_color, False, points, 2)
 
-        label = self.font_tiny.render("Throughput", True, UI_TEXT_SECONDARY)
+        label = self._text(self.font_tiny, "Throughput", UI_TEXT_SECONDARY)
         self.screen.blit(label, (gx + 5, gy + 3))
 
+        # Only static background lies under the graph, so the finished
+        # region can be replayed verbatim until the samples change
+        self._graph_surf = self.screen.subsurface((gx, gy, gw, gh)).copy()
+        self._graph_key = key
+
     # ─── full frame ───────────────────────
     def render_frame(self, roads, vehicles, controller, metrics, mode):
         self.frame_count += 1
-        self.draw_background()
-        self.draw_roads()
+        self.screen.blit(self._static_bg, (0, 0))
         self.draw_vehicles(vehicles)
         self.draw_traffic_lights(controller)
         self.draw_ui_overlay(metrics, mode)
         self.draw_throughput_graph(metrics.get("throughput_history", []), mode)
-        pygame.display.flip()
+
+        # Only push what can change: HUD, signal heads, and per lane one rect
+        # spanning its vehicles, this frame's and last frame's (the old one
+        # erases vehicles that moved or left). Lanes keep this to a few rects.
+        by_lane = {}
+        for v in vehicles:
+            by_lane.setdefault(v.lane, []).append(v.rect)
+        vehicle_rects = [rects[0].unionall(rects[1:]) for rects in by_lane.values()]
+        dirty = self._hud_rects + [l.bounds for l in controller.lights.values()]
+        dirty += self._prev_vehicle_rects
+        dirty += vehicle_rects
+        self._prev_vehicle_rects = vehicle_rects
+
+        if self._full_flip or len(dirty) > _MAX_DIRTY_RECTS:
+            self._full_flip = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)